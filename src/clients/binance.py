@@ -3,74 +3,208 @@ Binance API client for the DEX MCP server.
 """
 import asyncio
 import logging
-from typing import Dict, List, Optional
+import random
+import sys
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar, Union
+from urllib.parse import urlencode
 
 import aiohttp
+import msgspec
+import orjson
+from yarl import URL
 
 from ..config import config
-from ..exceptions import APIError, RateLimitError, ConnectionError
-from ..models import PriceData, KlineData, TickerStats24hr
+from ..exceptions import DEXMCPError, APIError, RateLimitError, ConnectionError
+from ..models import PriceData, KlineData, KlineFrame, TickerStats24hr
+from .cache import TTLCache
+from .ratelimit import TokenBucket
 
 logger = logging.getLogger(__name__)
 
+# Request weights as documented by Binance for single-symbol calls
+ENDPOINT_WEIGHTS = {
+    "ticker/price": 2,
+    "ticker/24hr": 2,
+    "klines": 2,
+}
+
+# Request weight of a multi-symbol ticker/price call
+PRICE_BATCH_WEIGHT = 4
+
+# How long get_price waits to collect concurrent calls into one batch request, in seconds
+PRICE_BATCH_WINDOW = 0.005
+
+# How long parsed responses stay fresh, in seconds
+CACHE_TTLS = {
+    "ticker/price": 1.0,
+    "ticker/24hr": 5.0,
+    "klines": 60.0,
+}
+
+# Seconds per kline interval unit, used to cap the klines cache TTL
+_INTERVAL_UNIT_SECONDS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800, "M": 2592000}
+
+T = TypeVar("T")
+M = TypeVar("M")
+
+
+def _24hr_stats_batch_weight(count: int) -> int:
+    """Request weight of a multi-symbol ticker/24hr call."""
+    if count <= 20:
+        return 2
+    if count <= 100:
+        return 40
+    return 80
+
+
+def _klines_cache_ttl(interval: str) -> float:
+    """
+    Get the cache TTL for klines of the given interval.
+    
+    The latest candle is still open, so klines are never cached for longer
+    than one interval.
+    """
+    interval_seconds = int(interval[:-1]) * _INTERVAL_UNIT_SECONDS[interval[-1]]
+    return min(CACHE_TTLS["klines"], interval_seconds)
+
 
 class BinanceClient:
     """Async client for Binance API with connection pooling and error handling."""
     
     def __init__(self):
         self._session: Optional[aiohttp.ClientSession] = None
+        self._resolver: Optional[aiohttp.AsyncResolver] = None
+        self._bucket = TokenBucket(
+            rate=config.rate_limit_weight / 60,
+            burst=config.rate_limit_weight
+        )
+        self._cache = TTLCache(maxsize=512)
+        self._responses = TTLCache(maxsize=256)
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._pending_prices: Dict[str, asyncio.Future] = {}
+        self._price_flush_handle: Optional[asyncio.TimerHandle] = None
+        self._background_tasks: set = set()
+        self._urls = {
+            endpoint: f"{config.base_url}/{endpoint}"
+            for endpoint in ("ping", "ticker/price", "klines", "ticker/24hr")
+        }
     
-    async def get_session(self) -> aiohttp.ClientSession:
-        """Get or create HTTP session with connection pooling."""
-        if self._session is None or self._session.closed:
-            connector = aiohttp.TCPConnector(
-                limit=config.connection_limit,
-                limit_per_host=config.connection_limit_per_host,
-                ttl_dns_cache=config.dns_cache_ttl,
-                use_dns_cache=True,
-            )
-            timeout = aiohttp.ClientTimeout(total=config.timeout)
-            self._session = aiohttp.ClientSession(
-                connector=connector,
-                timeout=timeout,
-                headers={"User-Agent": f"{config.server_name}/{config.server_version}"}
-            )
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Create the HTTP session shared by all requests until close()."""
+        # The connector doesn't own a resolver passed to it, so close() releases it
+        self._resolver = self._create_resolver()
+        connector = aiohttp.TCPConnector(
+            resolver=self._resolver,
+            limit=config.connection_limit,
+            limit_per_host=config.connection_limit_per_host,
+            ttl_dns_cache=config.dns_cache_ttl,
+            use_dns_cache=True,
+            keepalive_timeout=config.keepalive_timeout,
+        )
+        timeout = aiohttp.ClientTimeout(total=config.timeout)
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            headers={"User-Agent": f"{config.server_name}/{config.server_version}"}
+        )
         return self._session
     
+    @staticmethod
+    def _create_resolver() -> Optional[aiohttp.AsyncResolver]:
+        """Use the c-ares based resolver when available, else aiohttp's threaded default."""
+        # aiodns requires a selector event loop, which Windows doesn't use by default
+        if sys.platform == "win32":
+            return None
+        try:
+            return aiohttp.AsyncResolver()
+        except RuntimeError:
+            logger.debug("aiodns not installed, falling back to threaded DNS resolver")
+            return None
+    
+    async def warmup(self) -> None:
+        """
+        Open the HTTP session and issue a ping so DNS, TLS and the connection
+        pool are ready before the first tool call.
+        
+        Failures are logged rather than raised since warmup is best-effort.
+        """
+        if self._session is None:
+            self._create_session()
+        try:
+            await self._fetch_json_with_retry("ping", {})
+            logger.info("Binance client warmed up")
+        except DEXMCPError as e:
+            logger.warning(f"Binance client warmup failed: {e}")
+    
     async def close(self):
         """Close the HTTP session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        # Clear the attribute first so requests never pick up a closing session
+        session, self._session = self._session, None
+        resolver, self._resolver = self._resolver, None
+        if session and not session.closed:
+            await session.close()
             logger.info("Binance client session closed")
+        if resolver is not None:
+            await resolver.close()
     
-    async def _fetch_json_with_retry(self, endpoint: str, params: Dict) -> Dict:
-        """Fetch JSON data with retry logic and error handling."""
-        session = await self.get_session()
-        url = f"{config.base_url}/{endpoint}"
+    async def _fetch_json_with_retry(
+        self,
+        endpoint: str,
+        params: Dict,
+        weight: Optional[int] = None,
+        raw: bool = False
+    ) -> Any:
+        """
+        Fetch JSON data with retry logic and error handling.
+        
+        Returns the decoded JSON, or the undecoded response body if raw is set.
+        """
+        session = self._session or self._create_session()
+        base_url = self._urls.get(endpoint) or f"{config.base_url}/{endpoint}"
+        # Encode the query once up front so aiohttp doesn't re-parse and re-quote it
+        url = URL(f"{base_url}?{urlencode(params)}" if params else base_url, encoded=True)
+        if weight is None:
+            weight = ENDPOINT_WEIGHTS.get(endpoint, 1)
         
         last_exception = None
         for attempt in range(config.max_retries):
             try:
-                logger.debug(f"Fetching {url} with params {params} (attempt {attempt + 1})")
+                logger.debug(f"Fetching {url} (attempt {attempt + 1})")
                 
-                async with session.get(url, params=params) as resp:
+                await self._bucket.acquire(weight)
+                async with session.get(url) as resp:
+                    used_weight = resp.headers.get("X-MBX-USED-WEIGHT-1M")
+                    if used_weight is not None and used_weight.isdigit():
+                        self._bucket.sync_used(int(used_weight))
+                    
                     if resp.status == 200:
-                        data = await resp.json()
+                        body = await resp.read()
+                        # orjson parses the raw body considerably faster than resp.json()
+                        data = body if raw else orjson.loads(body)
                         logger.debug(f"Successfully fetched data from {endpoint}")
                         return data
                     elif resp.status == 429:  # Rate limit
                         retry_after = int(resp.headers.get('Retry-After', config.rate_limit_delay))
+                        last_exception = RateLimitError(retry_after=retry_after)
                         logger.warning(f"Rate limited on {endpoint}, retrying after {retry_after}s")
-                        await asyncio.sleep(retry_after * (2 ** attempt))
+                        delay = retry_after * (2 ** attempt)
+                        await asyncio.sleep(delay + random.uniform(0, 0.5 * delay))
                         continue
-                    else:
-                        error_text = await resp.text()
-                        raise APIError(
-                            f"HTTP {resp.status}: {error_text}",
-                            status_code=resp.status,
-                            endpoint=endpoint
-                        )
+                    
+                    error_text = await resp.text()
+                    error = APIError(
+                        f"HTTP {resp.status}: {error_text}",
+                        status_code=resp.status,
+                        endpoint=endpoint
+                    )
+                    # Client errors won't succeed on retry, except for request timeouts
+                    if 400 <= resp.status < 500 and resp.status != 408:
+                        raise error
+                    last_exception = error
+                    logger.warning(f"HTTP {resp.status} on attempt {attempt + 1} for {endpoint}")
                         
+            except APIError:
+                raise
             except asyncio.TimeoutError as e:
                 last_exception = APIError(f"Request timeout for {endpoint}", endpoint=endpoint)
                 logger.warning(f"Timeout on attempt {attempt + 1} for {endpoint}")
@@ -78,11 +212,13 @@ class BinanceClient:
                 last_exception = ConnectionError(f"Network error: {str(e)}")
                 logger.warning(f"Network error on attempt {attempt + 1} for {endpoint}: {e}")
             except Exception as e:
-                last_exception = APIError(f"Unexpected error: {str(e)}", endpoint=endpoint)
+                # Anything else (e.g. an undecodable body) won't be fixed by retrying
                 logger.error(f"Unexpected error on attempt {attempt + 1} for {endpoint}: {e}")
+                raise APIError(f"Unexpected error: {str(e)}", endpoint=endpoint) from e
             
             if attempt < config.max_retries - 1:
-                await asyncio.sleep(config.rate_limit_delay * (2 ** attempt))
+                # Full jitter keeps concurrent retries from synchronizing
+                await asyncio.sleep(random.uniform(0, config.rate_limit_delay * (2 ** attempt)))
         
         # If we get here, all retries failed
         raise last_exception or APIError(
@@ -90,10 +226,118 @@ class BinanceClient:
             endpoint=endpoint
         )
     
+    @staticmethod
+    def _cache_key(endpoint: str, params: Dict) -> str:
+        """Build a cache key that doesn't depend on parameter order."""
+        return f"{endpoint}?{urlencode(sorted(params.items()))}"
+    
+    async def _fetch_cached(
+        self,
+        endpoint: str,
+        params: Dict,
+        parse: Callable[[Any], T],
+        ttl: Optional[float] = None,
+        weight: Optional[int] = None,
+        raw: bool = False
+    ) -> T:
+        """
+        Fetch and parse a response, serving repeated requests from the cache.
+        
+        Concurrent identical requests share a single in-flight HTTP call.
+        
+        Args:
+            endpoint: API endpoint relative to the base URL
+            params: Query parameters
+            parse: Converts the response into the returned model
+            ttl: Cache TTL override, defaults to the endpoint's TTL
+            weight: Request weight override, defaults to the endpoint's weight
+            raw: Pass the undecoded response body to parse instead of decoded JSON
+            
+        Returns:
+            The parsed response
+        """
+        key = self._cache_key(endpoint, params)
+        
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        
+        task = self._inflight.get(key)
+        if task is None:
+            # The request runs in its own task so a cancelled caller can't cancel
+            # it for the other callers waiting on the same key
+            task = asyncio.create_task(
+                self._fetch_and_cache(key, endpoint, params, parse, ttl, weight, raw)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish_inflight(key, done))
+        
+        return await asyncio.shield(task)
+    
+    async def _fetch_and_cache(
+        self,
+        key: str,
+        endpoint: str,
+        params: Dict,
+        parse: Callable[[Any], T],
+        ttl: Optional[float],
+        weight: Optional[int],
+        raw: bool
+    ) -> T:
+        """Fetch and parse a response and store it in the cache."""
+        result = parse(await self._fetch_json_with_retry(endpoint, params, weight, raw))
+        self._cache.set(key, result, CACHE_TTLS.get(endpoint, 0) if ttl is None else ttl)
+        return result
+    
+    def _finish_inflight(self, key: str, task: asyncio.Task) -> None:
+        """Forget a completed in-flight request."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved when every caller was cancelled
+    
+    async def get_response(
+        self,
+        name: str,
+        fetch: Callable[..., Awaitable[M]],
+        build: Callable[[M], T],
+        *args: Any
+    ) -> T:
+        """
+        Fetch a model and convert it into a tool response.
+        
+        The response is kept alongside the model it was built from and reused
+        only while fetch keeps returning that same cached model, so it is
+        never staler than the model itself.
+        
+        Args:
+            name: Name identifying the response type
+            fetch: Client method returning the model
+            build: Converts the model into the response
+            *args: Arguments for fetch, also used as the cache key
+            
+        Returns:
+            The response built from the current model
+        """
+        model = await fetch(*args)
+        key = f"{name}{args!r}"
+        
+        entry = self._responses.get(key)
+        if entry is not None and entry[0] is model:
+            return entry[1]
+        
+        response = build(model)
+        # The TTL only bounds memory; freshness comes from the identity check above
+        self._responses.set(key, (model, response), max(CACHE_TTLS.values()))
+        return response
+    
     async def get_price(self, symbol: str) -> PriceData:
         """
         Get current price for a trading pair.
         
+        Concurrent calls within a short window are coalesced into a single
+        multi-symbol request.
+        
         Args:
             symbol: Trading pair symbol (e.g., BTCUSDT)
             
@@ -103,18 +347,122 @@ class BinanceClient:
         Raises:
             APIError: If API request fails
         """
-        data = await self._fetch_json_with_retry("ticker/price", {"symbol": symbol})
+        cached = self._cache.get(self._cache_key("ticker/price", {"symbol": symbol}))
+        if cached is not None:
+            return cached
+        
+        future = self._pending_prices.get(symbol)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending_prices[symbol] = future
+            if self._price_flush_handle is None:
+                self._price_flush_handle = loop.call_later(PRICE_BATCH_WINDOW, self._flush_prices)
+        
+        return await asyncio.shield(future)
+    
+    def _flush_prices(self) -> None:
+        """Resolve all pending get_price calls in a background task."""
+        pending, self._pending_prices = self._pending_prices, {}
+        self._price_flush_handle = None
+        
+        task = asyncio.create_task(self._resolve_prices(pending))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+    
+    async def _resolve_prices(self, pending: Dict[str, asyncio.Future]) -> None:
+        """Fetch prices for the pending symbols and complete their futures."""
+        symbols = list(pending)
+        results: Dict[str, Union[PriceData, BaseException]] = {}
+        try:
+            if len(symbols) > 1:
+                try:
+                    results.update(await self.get_prices(symbols))
+                except DEXMCPError as e:
+                    # A single unknown symbol fails the whole batch, so retry one by one
+                    logger.debug(f"Batch price request failed, falling back to single requests: {e}")
+            
+            missing = [symbol for symbol in symbols if symbol not in results]
+            if missing:
+                fetched = await asyncio.gather(
+                    *(self._fetch_price(symbol) for symbol in missing),
+                    return_exceptions=True
+                )
+                results.update(zip(missing, fetched))
+        except asyncio.CancelledError:
+            for future in pending.values():
+                future.cancel()
+            raise
+        except Exception as e:
+            # Never leave callers waiting, whatever went wrong
+            results = {symbol: e for symbol in symbols}
+        
+        for symbol, future in pending.items():
+            if future.done():
+                continue
+            result = results[symbol]
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+                future.exception()  # mark retrieved when nobody else is waiting
+            else:
+                future.set_result(result)
+    
+    async def _fetch_price(self, symbol: str) -> PriceData:
+        """Fetch the price for a single symbol."""
+        def parse(data: Dict) -> PriceData:
+            if "price" not in data:
+                raise APIError(f"Invalid response format for symbol {symbol}")
+            
+            return PriceData(
+                symbol=symbol,
+                price=float(data["price"]),
+                timestamp=data.get("timestamp")
+            )
+        
+        return await self._fetch_cached("ticker/price", {"symbol": symbol}, parse)
+    
+    async def get_prices(self, symbols: List[str]) -> Dict[str, PriceData]:
+        """
+        Get current prices for several trading pairs in one request.
         
-        if "price" not in data:
-            raise APIError(f"Invalid response format for symbol {symbol}")
+        Args:
+            symbols: Trading pair symbols
+            
+        Returns:
+            Mapping of symbol to PriceData
+            
+        Raises:
+            APIError: If API request fails
+        """
+        def parse(data: List) -> Dict[str, PriceData]:
+            if not isinstance(data, list):
+                raise APIError("Invalid response format for batch prices")
+            
+            try:
+                return {
+                    item["symbol"]: PriceData(symbol=item["symbol"], price=float(item["price"]))
+                    for item in data
+                }
+            except (KeyError, TypeError, ValueError) as e:
+                raise APIError(f"Invalid item in batch prices response: {e!r}")
         
-        return PriceData(
-            symbol=symbol,
-            price=float(data["price"]),
-            timestamp=data.get("timestamp")
+        prices = await self._fetch_cached(
+            "ticker/price",
+            {"symbols": orjson.dumps(symbols).decode()},
+            parse,
+            weight=PRICE_BATCH_WEIGHT
         )
+        
+        # Make the results available to single-symbol lookups as well
+        for symbol, price_data in prices.items():
+            self._cache.set(
+                self._cache_key("ticker/price", {"symbol": symbol}),
+                price_data,
+                CACHE_TTLS["ticker/price"]
+            )
+        return prices
     
-    async def get_klines(self, symbol: str, interval: str, limit: int) -> List[KlineData]:
+    async def get_klines(self, symbol: str, interval: str, limit: int) -> KlineFrame:
         """
         Get candlestick data for a trading pair.
         
@@ -124,31 +472,44 @@ class BinanceClient:
             limit: Number of klines to return
             
         Returns:
-            List of KlineData objects
+            KlineFrame with the parsed klines
             
         Raises:
             APIError: If API request fails
         """
-        raw_data = await self._fetch_json_with_retry(
-            "klines",
-            {"symbol": symbol, "interval": interval, "limit": limit}
-        )
-        
-        if not isinstance(raw_data, list):
-            raise APIError(f"Invalid response format for klines")
-        
-        klines = []
-        for raw_kline in raw_data:
-            if len(raw_kline) < 6:
-                logger.warning(f"Incomplete kline data: {raw_kline}")
-                continue
+        def parse(raw_data: List) -> KlineFrame:
+            if not isinstance(raw_data, list):
+                raise APIError(f"Invalid response format for klines")
+            
+            rows = []
+            for raw_kline in raw_data:
+                if len(raw_kline) < 6:
+                    logger.warning(f"Incomplete kline data: {raw_kline}")
+                    continue
+                rows.append(raw_kline)
+            
             try:
-                klines.append(KlineData.from_binance_data(raw_kline))
-            except (ValueError, IndexError) as e:
-                logger.warning(f"Error processing kline {raw_kline}: {e}")
-                continue
+                return KlineFrame.from_binance_data(rows)
+            except (ValueError, TypeError):
+                pass
+            
+            # Fall back to row-by-row parsing to skip the malformed klines
+            klines = []
+            for raw_kline in rows:
+                try:
+                    klines.append(KlineData.from_binance_data(raw_kline))
+                except (ValueError, TypeError) as e:
+                    logger.warning(f"Error processing kline {raw_kline}: {e}")
+                    continue
+            
+            return KlineFrame.from_klines(klines)
         
-        return klines
+        return await self._fetch_cached(
+            "klines",
+            {"symbol": symbol, "interval": interval, "limit": limit},
+            parse,
+            ttl=_klines_cache_ttl(interval)
+        )
     
     async def get_24hr_stats(self, symbol: str) -> TickerStats24hr:
         """
@@ -163,16 +524,48 @@ class BinanceClient:
         Raises:
             APIError: If API request fails
         """
-        data = await self._fetch_json_with_retry("ticker/24hr", {"symbol": symbol})
+        def parse(body: bytes) -> TickerStats24hr:
+            # Decode straight into the model, which also validates required fields
+            try:
+                return TickerStats24hr.from_binance_bytes(body)
+            except msgspec.DecodeError as e:
+                raise APIError(f"Invalid 24hr stats response: {e}")
         
-        # Validate response format
-        required_fields = [
-            "priceChange", "priceChangePercent", "weightedAvgPrice",
-            "prevClosePrice", "lastPrice", "volume", "quoteVolume"
-        ]
+        return await self._fetch_cached("ticker/24hr", {"symbol": symbol}, parse, raw=True)
+    
+    async def get_24hr_stats_batch(self, symbols: List[str]) -> Dict[str, TickerStats24hr]:
+        """
+        Get 24hr ticker statistics for several symbols in one request.
         
-        for field in required_fields:
-            if field not in data:
-                raise APIError(f"Missing field {field} in 24hr stats response")
+        Args:
+            symbols: Trading pair symbols
+            
+        Returns:
+            Mapping of symbol to TickerStats24hr
+            
+        Raises:
+            APIError: If API request fails
+        """
+        def parse(body: bytes) -> Dict[str, TickerStats24hr]:
+            try:
+                items = msgspec.json.decode(body, type=List[TickerStats24hr], strict=False)
+            except msgspec.DecodeError as e:
+                raise APIError(f"Invalid response format for batch 24hr stats: {e}")
+            
+            return {item.symbol: item for item in items}
         
-        return TickerStats24hr.from_binance_data(data) 
\ No newline at end of file
+        stats = await self._fetch_cached(
+            "ticker/24hr",
+            {"symbols": orjson.dumps(symbols).decode()},
+            parse,
+            weight=_24hr_stats_batch_weight(len(symbols)),
+            raw=True
+        )
+        
+        for symbol, symbol_stats in stats.items():
+            self._cache.set(
+                self._cache_key("ticker/24hr", {"symbol": symbol}),
+                symbol_stats,
+                CACHE_TTLS["ticker/24hr"]
+            )
+        return stats 
\ No newline at end of file
@@ -0,0 +1,55 @@
+"""
+Client-side rate limiting for the DEX MCP server.
+"""
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Async token bucket that paces requests against an API weight budget."""
+    
+    def __init__(self, rate: float, burst: float):
+        """
+        Args:
+            rate: Tokens replenished per second
+            burst: Maximum number of tokens the bucket can hold
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    async def acquire(self, weight: float = 1) -> None:
+        """
+        Wait until enough tokens are available and consume them.
+        
+        Args:
+            weight: Number of tokens the request costs
+        """
+        weight = min(weight, self.burst)
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= weight:
+                    self._tokens -= weight
+                    return
+                await asyncio.sleep((weight - self._tokens) / self.rate)
+    
+    def sync_used(self, used: float) -> None:
+        """
+        Reconcile the local estimate with the usage reported by the server.
+        
+        Args:
+            used: Weight the server reports as already consumed in the window
+        """
+        self._refill()
+        remaining = max(0.0, self.burst - used)
+        if remaining < self._tokens:
+            self._tokens = remaining
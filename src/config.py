@@ -15,11 +15,13 @@ class ServerConfig:
     timeout: int = 10
     max_retries: int = 3
     rate_limit_delay: float = 0.1  # seconds between requests
+    rate_limit_weight: int = 1200  # request weight allowed per minute
     
     # Connection Pool Configuration
     connection_limit: int = 100
     connection_limit_per_host: int = 30
     dns_cache_ttl: int = 300
+    keepalive_timeout: float = 60  # seconds idle connections stay open
     
     # Server Configuration
     server_name: str = "dex-mcp-server"
@@ -36,9 +38,11 @@ class ServerConfig:
             timeout=int(os.getenv("API_TIMEOUT", "10")),
             max_retries=int(os.getenv("MAX_RETRIES", "3")),
             rate_limit_delay=float(os.getenv("RATE_LIMIT_DELAY", "0.1")),
+            rate_limit_weight=int(os.getenv("RATE_LIMIT_WEIGHT", "1200")),
             connection_limit=int(os.getenv("CONNECTION_LIMIT", "100")),
             connection_limit_per_host=int(os.getenv("CONNECTION_LIMIT_PER_HOST", "30")),
             dns_cache_ttl=int(os.getenv("DNS_CACHE_TTL", "300")),
+            keepalive_timeout=float(os.getenv("KEEPALIVE_TIMEOUT", "60")),
             server_name=os.getenv("SERVER_NAME", "dex-mcp-server"),
             server_version=os.getenv("SERVER_VERSION", "1.0.0"),
             log_level=os.getenv("LOG_LEVEL", "INFO"),
@@ -49,7 +53,8 @@ class ServerConfig:
 config = ServerConfig.from_env()
 
 # Valid intervals for Binance API
-VALID_INTERVALS = {
+VALID_INTERVALS = frozenset({
     "1s", "1m", "3m", "5m", "15m", "30m", "1h", "2h", "4h", "6h", "8h", "12h",
     "1d", "3d", "1w", "1M"
-} 
\ No newline at end of file
+})
+VALID_INTERVALS_STR = ', '.join(sorted(VALID_INTERVALS)) 
\ No newline at end of file
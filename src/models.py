@@ -1,21 +1,21 @@
 """
 Data models and schemas for the DEX MCP server.
 """
-from dataclasses import dataclass
-from typing import List, Union, Optional, Dict, Any
+from typing import List, Union, Optional, Any, Iterator
 from datetime import datetime
 
+import msgspec
+from msgspec import Struct
 
-@dataclass
-class PriceData:
+
+class PriceData(Struct, frozen=True):
     """Model for price data response."""
     symbol: str
     price: float
     timestamp: Optional[int] = None
 
 
-@dataclass
-class KlineData:
+class KlineData(Struct, frozen=True):
     """Model for a single kline (candlestick) data point."""
     timestamp: int
     open: float
@@ -37,8 +37,37 @@ class KlineData:
         )
 
 
-@dataclass
-class AveragePriceData:
+class KlineFrame(Struct, frozen=True):
+    """
+    Model for a series of klines.
+    
+    Rows are parsed once into [timestamp, open, high, low, close, volume]
+    lists, which is already the tool response format.
+    """
+    rows: List[List[Union[int, float]]]
+    
+    @classmethod
+    def from_binance_data(cls, raw_data: List[List[Union[str, float]]]) -> "KlineFrame":
+        """Create KlineFrame from Binance API response rows."""
+        return cls([
+            [int(raw[0]), float(raw[1]), float(raw[2]), float(raw[3]), float(raw[4]), float(raw[5])]
+            for raw in raw_data
+        ])
+    
+    @classmethod
+    def from_klines(cls, klines: List[KlineData]) -> "KlineFrame":
+        """Create KlineFrame from individual KlineData rows."""
+        return cls([[k.timestamp, k.open, k.high, k.low, k.close, k.volume] for k in klines])
+    
+    def __len__(self) -> int:
+        return len(self.rows)
+    
+    def closes(self) -> Iterator[float]:
+        """Iterate over the close prices."""
+        return (row[4] for row in self.rows)
+
+
+class AveragePriceData(Struct, frozen=True):
     """Model for average price calculation response."""
     symbol: str
     average_price: float
@@ -47,9 +76,8 @@ class AveragePriceData:
     calculation_time: Optional[int] = None
 
 
-@dataclass
-class TickerStats24hr:
-    """Model for 24hr ticker statistics."""
+class TickerStats24hr(Struct, frozen=True, rename="camel"):
+    """Model for 24hr ticker statistics, decoded from Binance's camelCase fields."""
     symbol: str
     price_change: float
     price_change_percent: float
@@ -58,34 +86,19 @@ class TickerStats24hr:
     last_price: float
     volume: float
     quote_volume: float
-    open_time: int
-    close_time: int
+    open_time: int = 0
+    close_time: int = 0
     
     @classmethod
-    def from_binance_data(cls, data: Dict[str, Any]) -> "TickerStats24hr":
-        """Create TickerStats24hr from Binance API response."""
-        return cls(
-            symbol=data["symbol"],
-            price_change=float(data["priceChange"]),
-            price_change_percent=float(data["priceChangePercent"]),
-            weighted_avg_price=float(data["weightedAvgPrice"]),
-            prev_close_price=float(data["prevClosePrice"]),
-            last_price=float(data["lastPrice"]),
-            volume=float(data["volume"]),
-            quote_volume=float(data["quoteVolume"]),
-            open_time=int(data.get("openTime", 0)),
-            close_time=int(data.get("closeTime", 0))
-        )
+    def from_binance_bytes(cls, data: bytes) -> "TickerStats24hr":
+        """Decode TickerStats24hr directly from a raw Binance API response body."""
+        # strict=False lets msgspec convert Binance's numeric strings to floats
+        return msgspec.json.decode(data, type=cls, strict=False)
 
 
-@dataclass
-class APIResponse:
+class APIResponse(Struct, frozen=True):
     """Generic API response wrapper."""
     success: bool
     data: Any
     error: Optional[str] = None
-    timestamp: Optional[datetime] = None
-    
-    def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.utcnow()
\ No newline at end of file
+    timestamp: Optional[datetime] = msgspec.field(default_factory=datetime.utcnow)
\ No newline at end of file
@@ -3,8 +3,9 @@ Main server module for the DEX MCP server.
 """
 import asyncio
 import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
-import uvloop
 from mcp.server.fastmcp import FastMCP
 
 from .config import config
@@ -12,9 +13,6 @@ from .clients import BinanceClient
 from .tools import register_price_tools, register_market_tools
 from .utils import setup_logging, setup_lifecycle_handlers, register_cleanup_function
 
-# Use uvloop for faster event loop on Unix systems
-asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
-
 logger = logging.getLogger(__name__)
 
 
@@ -22,12 +20,11 @@ class DEXMCPServer:
     """Main DEX MCP Server class."""
     
     def __init__(self):
-        self.server = FastMCP(config.server_name)
+        self.server = FastMCP(config.server_name, lifespan=self._lifespan)
         self.binance_client = BinanceClient()
         
-        # Setup logging and lifecycle management
+        # Setup logging; signal handlers are installed once the event loop runs
         setup_logging()
-        setup_lifecycle_handlers()
         
         # Register cleanup functions
         register_cleanup_function(self.cleanup)
@@ -37,6 +34,23 @@ class DEXMCPServer:
         
         logger.info(f"DEX MCP Server initialized (version {config.server_version})")
     
+    @asynccontextmanager
+    async def _lifespan(self, server: FastMCP) -> AsyncIterator[None]:
+        """
+        Manage resources for the lifetime of the server's event loop.
+        
+        Warms up the Binance client in the background on startup and closes
+        its session deterministically on shutdown.
+        """
+        setup_lifecycle_handlers()
+        warmup_task = asyncio.create_task(self.binance_client.warmup())
+        try:
+            yield
+        finally:
+            if not warmup_task.done():
+                warmup_task.cancel()
+            await self.cleanup()
+    
     def _register_tools(self) -> None:
         """Register all MCP tools with the server."""
         register_price_tools(self.server, self.binance_client)
@@ -53,6 +67,7 @@ class DEXMCPServer:
         """Run the MCP server."""
         try:
             logger.info("Starting DEX MCP Server...")
+            _install_uvloop()
             self.server.run()  # stdio transport by default
         except KeyboardInterrupt:
             logger.info("Server interrupted by user")
@@ -64,6 +79,16 @@ class DEXMCPServer:
             logger.info("Server shutdown complete")
 
 
+def _install_uvloop() -> None:
+    """Use uvloop for a faster event loop where it is available (not on Windows)."""
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop not available, using the default asyncio event loop")
+        return
+    uvloop.install()
+
+
 def create_server() -> DEXMCPServer:
     """Factory function to create a server instance."""
     return DEXMCPServer()
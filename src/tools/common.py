@@ -0,0 +1,40 @@
+"""
+Shared helpers for the DEX MCP server tools.
+"""
+import logging
+from typing import Awaitable, TypeVar
+
+from ..exceptions import ValidationError, APIError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Errors that already carry a meaningful message for the MCP client
+_EXPECTED_ERRORS = (ValidationError, APIError)
+
+
+async def run_tool(coro: Awaitable[T], tool_name: str, action: str, symbol: str) -> T:
+    """
+    Await a tool's work, wrapping unexpected errors in an APIError.
+    
+    Args:
+        coro: The tool's pending work
+        tool_name: Tool name used in the log message
+        action: What the tool does, used in the error message (e.g. "get price")
+        symbol: Trading pair symbol the tool was called for
+        
+    Returns:
+        The result of the coroutine
+        
+    Raises:
+        ValidationError: Passed through unchanged
+        APIError: For API failures and any unexpected error
+    """
+    try:
+        return await coro
+    except _EXPECTED_ERRORS:
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error in {tool_name}: {e}")
+        raise APIError(f"Failed to {action} for {symbol}: {str(e)}") 
\ No newline at end of file
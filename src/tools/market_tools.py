@@ -5,10 +5,11 @@ import logging
 from typing import Dict, Union
 
 from mcp.server.fastmcp import FastMCP
+from msgspec.structs import asdict
 
 from ..clients import BinanceClient
 from ..validators import validate_symbol
-from ..exceptions import ValidationError, APIError
+from .common import run_tool
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +17,13 @@ logger = logging.getLogger(__name__)
 def register_market_tools(server: FastMCP, binance_client: BinanceClient) -> None:
     """Register market-related tools with the MCP server."""
     
+    # Tool responses are memoized alongside the cached models they are built from
+    async def _24hr_stats_response(symbol: str) -> Dict[str, Union[str, float]]:
+        # asdict keeps the snake_case attribute names rather than Binance's camelCase
+        return await binance_client.get_response(
+            "24hr_stats", binance_client.get_24hr_stats, asdict, symbol
+        )
+    
     @server.tool()
     async def get_24hr_stats(symbol: str = "BTCUSDT") -> Dict[str, Union[str, float]]:
         """
@@ -27,24 +35,5 @@ def register_market_tools(server: FastMCP, binance_client: BinanceClient) -> Non
         Returns:
             Dictionary with comprehensive 24hr statistics
         """
-        try:
-            symbol = validate_symbol(symbol)
-            stats = await binance_client.get_24hr_stats(symbol)
-            
-            return {
-                "symbol": stats.symbol,
-                "price_change": stats.price_change,
-                "price_change_percent": stats.price_change_percent,
-                "weighted_avg_price": stats.weighted_avg_price,
-                "prev_close_price": stats.prev_close_price,
-                "last_price": stats.last_price,
-                "volume": stats.volume,
-                "quote_volume": stats.quote_volume,
-                "open_time": stats.open_time,
-                "close_time": stats.close_time,
-            }
-        except (ValidationError, APIError):
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error in get_24hr_stats: {e}")
-            raise APIError(f"Failed to get 24hr stats for {symbol}: {str(e)}") 
\ No newline at end of file
+        symbol = validate_symbol(symbol)
+        return await run_tool(_24hr_stats_response(symbol), "get_24hr_stats", "get 24hr stats", symbol) 
\ No newline at end of file
@@ -2,14 +2,18 @@
 Price-related MCP tools for the DEX MCP server.
 """
 import logging
+from operator import attrgetter
+from statistics import fmean
 from typing import Dict, List, Union
 
 from mcp.server.fastmcp import FastMCP
+from msgspec.structs import asdict
 
 from ..clients import BinanceClient
 from ..validators import validate_symbol, validate_interval, validate_limit
-from ..exceptions import ValidationError, APIError
-from ..models import AveragePriceData
+from ..exceptions import APIError
+from ..models import AveragePriceData, KlineFrame
+from .common import run_tool
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +21,32 @@ logger = logging.getLogger(__name__)
 def register_price_tools(server: FastMCP, binance_client: BinanceClient) -> None:
     """Register price-related tools with the MCP server."""
     
+    # Tool responses are memoized alongside the cached models they are built from
+    async def _price_response(symbol: str) -> Dict[str, Union[str, float]]:
+        return await binance_client.get_response("price", binance_client.get_price, asdict, symbol)
+    
+    async def _klines_response(symbol: str, interval: str, limit: int) -> List[List[Union[int, float]]]:
+        return await binance_client.get_response(
+            "klines", binance_client.get_klines, attrgetter("rows"), symbol, interval, limit
+        )
+    
+    async def _average_price_response(symbol: str, interval: str, limit: int) -> Dict[str, Union[str, float, int]]:
+        def build(klines: KlineFrame) -> Dict[str, Union[str, float, int]]:
+            if not klines:
+                raise APIError(f"No kline data available for {symbol}")
+            
+            return asdict(AveragePriceData(
+                symbol=symbol,
+                average_price=fmean(klines.closes()),
+                interval=interval,
+                period_count=len(klines),
+                calculation_time=klines.rows[-1][0]
+            ))
+        
+        return await binance_client.get_response(
+            "average_price", binance_client.get_klines, build, symbol, interval, limit
+        )
+    
     @server.tool()
     async def get_price(symbol: str = "BTCUSDT") -> Dict[str, Union[str, float]]:
         """
@@ -32,20 +62,8 @@ def register_price_tools(server: FastMCP, binance_client: BinanceClient) -> None
             ValidationError: If symbol format is invalid
             APIError: If API request fails
         """
-        try:
-            symbol = validate_symbol(symbol)
-            price_data = await binance_client.get_price(symbol)
-            
-            return {
-                "symbol": price_data.symbol,
-                "price": price_data.price,
-                "timestamp": price_data.timestamp
-            }
-        except (ValidationError, APIError):
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error in get_price: {e}")
-            raise APIError(f"Failed to get price for {symbol}: {str(e)}")
+        symbol = validate_symbol(symbol)
+        return await run_tool(_price_response(symbol), "get_price", "get price", symbol)
     
     @server.tool()
     async def get_klines(
@@ -64,23 +82,11 @@ def register_price_tools(server: FastMCP, binance_client: BinanceClient) -> None
         Returns:
             List of klines: [timestamp, open, high, low, close, volume]
         """
-        try:
-            symbol = validate_symbol(symbol)
-            interval = validate_interval(interval)
-            limit = validate_limit(limit)
-            
-            klines = await binance_client.get_klines(symbol, interval, limit)
-            
-            # Convert to expected format
-            return [
-                [kline.timestamp, kline.open, kline.high, kline.low, kline.close, kline.volume]
-                for kline in klines
-            ]
-        except (ValidationError, APIError):
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error in get_klines: {e}")
-            raise APIError(f"Failed to get klines for {symbol}: {str(e)}")
+        symbol = validate_symbol(symbol)
+        interval = validate_interval(interval)
+        limit = validate_limit(limit)
+        
+        return await run_tool(_klines_response(symbol, interval, limit), "get_klines", "get klines", symbol)
     
     @server.tool()
     async def average_price(
@@ -99,36 +105,13 @@ def register_price_tools(server: FastMCP, binance_client: BinanceClient) -> None
         Returns:
             Dictionary with symbol, average price, and calculation metadata
         """
-        try:
-            symbol = validate_symbol(symbol)
-            interval = validate_interval(interval)
-            limit = validate_limit(limit)
-            
-            klines = await binance_client.get_klines(symbol, interval, limit)
-            
-            if not klines:
-                raise APIError(f"No kline data available for {symbol}")
-            
-            closes = [kline.close for kline in klines]
-            avg_price = sum(closes) / len(closes)
-            
-            avg_data = AveragePriceData(
-                symbol=symbol,
-                average_price=avg_price,
-                interval=interval,
-                period_count=len(closes),
-                calculation_time=klines[-1].timestamp if klines else None
-            )
-            
-            return {
-                "symbol": avg_data.symbol,
-                "average_price": avg_data.average_price,
-                "interval": avg_data.interval,
-                "period_count": avg_data.period_count,
-                "calculation_time": avg_data.calculation_time
-            }
-        except (ValidationError, APIError):
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error in average_price: {e}")
-            raise APIError(f"Failed to calculate average price for {symbol}: {str(e)}") 
\ No newline at end of file
+        symbol = validate_symbol(symbol)
+        interval = validate_interval(interval)
+        limit = validate_limit(limit)
+        
+        return await run_tool(
+            _average_price_response(symbol, interval, limit),
+            "average_price",
+            "calculate average price",
+            symbol
+        ) 
\ No newline at end of file
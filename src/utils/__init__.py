@@ -3,6 +3,6 @@ Utility functions for the DEX MCP server.
 """
 
 from .logging import setup_logging
-from .lifecycle import setup_lifecycle_handlers
+from .lifecycle import setup_lifecycle_handlers, register_cleanup_function
 
-__all__ = ["setup_logging", "setup_lifecycle_handlers"] 
\ No newline at end of file
+__all__ = ["setup_logging", "setup_lifecycle_handlers", "register_cleanup_function"] 
\ No newline at end of file
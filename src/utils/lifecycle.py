@@ -4,13 +4,16 @@ Lifecycle management utilities for the DEX MCP server.
 import asyncio
 import signal
 import logging
-from typing import List, Callable, Awaitable
+from typing import List, Callable, Awaitable, Set
 
 logger = logging.getLogger(__name__)
 
 # Global list of cleanup functions
 _cleanup_functions: List[Callable[[], Awaitable[None]]] = []
 
+# Strong references to running shutdown tasks so they aren't garbage collected
+_shutdown_tasks: Set[asyncio.Task] = set()
+
 
 def register_cleanup_function(func: Callable[[], Awaitable[None]]) -> None:
     """
@@ -38,22 +41,34 @@ async def cleanup_all() -> None:
 
 
 def setup_lifecycle_handlers() -> None:
-    """Setup signal handlers for graceful shutdown."""
+    """
+    Setup signal handlers for graceful shutdown.
+    
+    Must be called from within the running event loop so cleanup coroutines
+    are scheduled on the loop that owns the resources being cleaned up.
+    """
+    loop = asyncio.get_running_loop()
     
-    def signal_handler(signum, frame):
+    async def shutdown(signum: int) -> None:
+        """Run cleanup, then re-deliver the signal with its default behaviour."""
+        await cleanup_all()
+        loop.remove_signal_handler(signum)
+        # Raise outside this task so a KeyboardInterrupt reaches the loop runner
+        loop.call_soon(signal.raise_signal, signum)
+    
+    def signal_handler(signum: int) -> None:
         """Handle shutdown signals."""
         logger.info(f"Received signal {signum}, initiating graceful shutdown...")
-        
-        # Get the current event loop
-        try:
-            loop = asyncio.get_running_loop()
-            loop.create_task(cleanup_all())
-        except RuntimeError:
-            # No event loop running, create one
-            asyncio.run(cleanup_all())
+        task = loop.create_task(shutdown(signum))
+        _shutdown_tasks.add(task)
+        task.add_done_callback(_shutdown_tasks.discard)
     
     # Register signal handlers for graceful shutdown
-    signal.signal(signal.SIGTERM, signal_handler)
-    signal.signal(signal.SIGINT, signal_handler)
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(signum, signal_handler, signum)
+        except NotImplementedError:
+            # Windows event loops don't support signal handlers
+            logger.debug(f"Signal handler for {signum} not supported on this platform")
     
     logger.info("Lifecycle handlers configured") 
\ No newline at end of file
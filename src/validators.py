@@ -1,15 +1,21 @@
 """
 Input validation utilities for the DEX MCP server.
 """
-import re
+from functools import lru_cache
 from typing import Any
 
-from .config import VALID_INTERVALS
+from .config import VALID_INTERVALS, VALID_INTERVALS_STR
 from .exceptions import ValidationError
 
 
-# Symbol pattern validation (basic validation for common trading pairs)
-SYMBOL_PATTERN = re.compile(r'^[A-Z0-9]{6,12}$')
+@lru_cache(maxsize=1024)
+def _normalize_symbol(symbol: str) -> str:
+    """Normalize a symbol and check it is 6-12 uppercase ASCII letters or digits."""
+    symbol = symbol.upper().strip()
+    if not (6 <= len(symbol) <= 12 and symbol.isascii() and symbol.isalnum()):
+        raise ValidationError(f"Invalid symbol format: {symbol}", field="symbol")
+    
+    return symbol
 
 
 def validate_symbol(symbol: Any) -> str:
@@ -28,11 +34,7 @@ def validate_symbol(symbol: Any) -> str:
     if not symbol or not isinstance(symbol, str):
         raise ValidationError("Symbol must be a non-empty string", field="symbol")
     
-    symbol = symbol.upper().strip()
-    if not SYMBOL_PATTERN.match(symbol):
-        raise ValidationError(f"Invalid symbol format: {symbol}", field="symbol")
-    
-    return symbol
+    return _normalize_symbol(symbol)
 
 
 def validate_interval(interval: Any) -> str:
@@ -52,9 +54,8 @@ def validate_interval(interval: Any) -> str:
         raise ValidationError("Interval must be a string", field="interval")
         
     if interval not in VALID_INTERVALS:
-        valid_intervals_str = ', '.join(sorted(VALID_INTERVALS))
         raise ValidationError(
-            f"Invalid interval: {interval}. Valid intervals: {valid_intervals_str}",
+            f"Invalid interval: {interval}. Valid intervals: {VALID_INTERVALS_STR}",
             field="interval"
         )
     return interval
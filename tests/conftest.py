@@ -0,0 +1,87 @@
+"""
+Shared fixtures for the DEX MCP server tests.
+"""
+import asyncio
+import json
+from typing import Dict, List
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.clients import BinanceClient
+from src.config import config
+
+
+class StubBinance:
+    """Minimal local stand-in for the Binance REST API."""
+    
+    def __init__(self):
+        self.prices: Dict[str, str] = {"BTCUSDT": "65000.5", "ETHUSDT": "3200.25", "XRPUSDT": "0.5"}
+        self.delay = 0.0
+        self.malformed_batch = False
+        self.requests: List[Dict[str, str]] = []
+    
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/api/v3/ticker/price", self.ticker_price)
+        app.router.add_get("/api/v3/klines", self.klines)
+        return app
+    
+    def requests_for(self, path: str) -> List[Dict[str, str]]:
+        return [query for query in self.requests if query["path"] == path]
+    
+    async def _record(self, request: web.Request) -> None:
+        self.requests.append({"path": request.path, **request.query})
+        if self.delay:
+            await asyncio.sleep(self.delay)
+    
+    def _invalid_symbol(self) -> web.Response:
+        return web.json_response({"code": -1121, "msg": "Invalid symbol."}, status=400)
+    
+    async def ticker_price(self, request: web.Request) -> web.Response:
+        await self._record(request)
+        
+        if "symbols" in request.query:
+            symbols = json.loads(request.query["symbols"])
+            if self.malformed_batch:
+                return web.json_response([{"sym": symbol} for symbol in symbols])
+            if any(symbol not in self.prices for symbol in symbols):
+                return self._invalid_symbol()
+            return web.json_response(
+                [{"symbol": symbol, "price": self.prices[symbol]} for symbol in symbols]
+            )
+        
+        symbol = request.query["symbol"]
+        if symbol not in self.prices:
+            return self._invalid_symbol()
+        return web.json_response({"symbol": symbol, "price": self.prices[symbol]})
+    
+    async def klines(self, request: web.Request) -> web.Response:
+        await self._record(request)
+        limit = int(request.query["limit"])
+        return web.json_response([
+            [1700000000000 + i * 60000, "100.0", "101.0", "99.0", "100.5", "10.0",
+             1700000059999, "1005.0", 42, "5.0", "502.5", "0"]
+            for i in range(limit)
+        ])
+
+
+@pytest.fixture
+async def stub_binance(monkeypatch):
+    """Run a StubBinance server and point the client configuration at it."""
+    stub = StubBinance()
+    server = TestServer(stub.app())
+    await server.start_server()
+    monkeypatch.setattr(config, "base_url", str(server.make_url("/api/v3")))
+    monkeypatch.setattr(config, "rate_limit_delay", 0.0)
+    yield stub
+    await server.close()
+
+
+@pytest.fixture
+async def binance_client(stub_binance):
+    """BinanceClient talking to the stub server."""
+    client = BinanceClient()
+    yield client
+    await client.close()
@@ -0,0 +1,82 @@
+"""
+Tests for request sharing and batching in the Binance client.
+"""
+import asyncio
+
+from src.exceptions import APIError
+from src.models import KlineFrame
+
+
+async def test_concurrent_identical_requests_share_one_call(stub_binance, binance_client):
+    stub_binance.delay = 0.05
+    
+    first, second = await asyncio.gather(
+        binance_client.get_klines("BTCUSDT", "1m", 3),
+        binance_client.get_klines("BTCUSDT", "1m", 3),
+    )
+    
+    assert isinstance(first, KlineFrame)
+    assert first is second
+    assert len(stub_binance.requests_for("/api/v3/klines")) == 1
+
+
+async def test_cancelled_caller_does_not_cancel_shared_request(stub_binance, binance_client):
+    stub_binance.delay = 0.1
+    
+    cancelled = asyncio.create_task(binance_client.get_klines("BTCUSDT", "1m", 1))
+    waiting = asyncio.create_task(binance_client.get_klines("BTCUSDT", "1m", 1))
+    await asyncio.sleep(0.02)
+    cancelled.cancel()
+    
+    klines = await asyncio.wait_for(waiting, timeout=2)
+    
+    assert cancelled.cancelled()
+    assert len(klines) == 1
+    assert len(stub_binance.requests_for("/api/v3/klines")) == 1
+
+
+async def test_concurrent_get_price_calls_are_batched(stub_binance, binance_client):
+    prices = await asyncio.gather(
+        binance_client.get_price("BTCUSDT"),
+        binance_client.get_price("ETHUSDT"),
+        binance_client.get_price("XRPUSDT"),
+    )
+    
+    assert [price.price for price in prices] == [65000.5, 3200.25, 0.5]
+    requests = stub_binance.requests_for("/api/v3/ticker/price")
+    assert len(requests) == 1
+    assert "symbols" in requests[0]
+
+
+async def test_batch_rejection_falls_back_to_single_requests(stub_binance, binance_client):
+    results = await asyncio.gather(
+        binance_client.get_price("BTCUSDT"),
+        binance_client.get_price("ETHUSDT"),
+        binance_client.get_price("BADBAD"),
+        return_exceptions=True,
+    )
+    
+    assert results[0].price == 65000.5
+    assert results[1].price == 3200.25
+    assert isinstance(results[2], APIError)
+    assert results[2].status_code == 400
+    
+    requests = stub_binance.requests_for("/api/v3/ticker/price")
+    assert sum("symbols" in query for query in requests) == 1
+    assert sorted(query["symbol"] for query in requests if "symbol" in query) == [
+        "BADBAD", "BTCUSDT", "ETHUSDT"
+    ]
+
+
+async def test_malformed_batch_item_does_not_leave_callers_waiting(stub_binance, binance_client):
+    stub_binance.malformed_batch = True
+    
+    prices = await asyncio.wait_for(
+        asyncio.gather(
+            binance_client.get_price("BTCUSDT"),
+            binance_client.get_price("ETHUSDT"),
+        ),
+        timeout=2,
+    )
+    
+    assert [price.price for price in prices] == [65000.5, 3200.25]